@@ -0,0 +1,131 @@
+"""Measure the per-call cost of logging on the emitting thread.
+
+Compares ``setup_logger`` (queue handler + background listener) against
+synchronous handlers, with and without the rotating JSON log file. Console
+output goes to ``os.devnull`` so terminal speed does not skew the numbers;
+log files are written to a temporary directory.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_logging
+"""
+
+import argparse
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from src.config import settings
+from src.utils import logger as log_module
+
+QUESTION = "How do I deploy an agent on Xyber?"
+# Format used by setup_logger before the queue-based logger was introduced
+BASELINE_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# name -> (log_json, write log file)
+QUEUE_CONFIGS = {
+    "queue console": (False, False),
+    "queue console+file": (False, True),
+    "queue json+file": (True, True),
+}
+
+
+def _baseline_logger(name: str, level: int, sink, log_dir: Path = None):
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(logging.Formatter(BASELINE_FORMAT))
+    logger.addHandler(handler)
+    if log_dir is not None:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / f"{name}.log",
+            maxBytes=settings.log_max_bytes,
+            backupCount=settings.log_backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(log_module.JsonFormatter())
+        logger.addHandler(file_handler)
+    return logger
+
+
+def _queue_logger(name: str, level: str) -> logging.Logger:
+    settings.log_level = level
+    return log_module.setup_logger(name)
+
+
+def _per_call_ns(fn, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def _cases(info_logger: logging.Logger, debug_logger: logging.Logger) -> dict:
+    return {
+        "info": lambda: info_logger.info("Processing query: %s", QUESTION),
+        "debug (sampled)": lambda: debug_logger.debug("Query text: %s", QUESTION),
+        "debug (filtered)": lambda: info_logger.debug("Query text: %s", QUESTION),
+    }
+
+
+def _measure(cases: dict, number: int, repeat: int) -> dict:
+    return {case: _per_call_ns(fn, number, repeat) for case, fn in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_logging")
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sink = open(os.devnull, "w")
+    real_stderr = sys.stderr
+    # The listener's console handler binds sys.stderr when it starts
+    sys.stderr = sink
+    results = {}
+    drains = {}
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            for name, log_dir in (("stream", None), ("stream+json file", tmp_dir)):
+                info = _baseline_logger(f"{name}.info", logging.INFO, sink, log_dir)
+                debug = _baseline_logger(f"{name}.debug", logging.DEBUG, sink, log_dir)
+                results[name] = _measure(_cases(info, debug), args.number, args.repeat)
+
+            for name, (log_json, write_file) in QUEUE_CONFIGS.items():
+                log_module.shutdown_logging()
+                settings.log_json = log_json
+                settings.log_dir = tmp_dir / name.replace(" ", "_")
+                if not write_file:
+                    settings.log_dir = None
+                results[name] = _measure(
+                    _cases(
+                        _queue_logger(f"bench.{name}.info", "INFO"),
+                        _queue_logger(f"bench.{name}.debug", "DEBUG"),
+                    ),
+                    args.number,
+                    args.repeat,
+                )
+                drain_start = time.perf_counter()
+                log_module.shutdown_logging()
+                drains[name] = time.perf_counter() - drain_start
+    finally:
+        sys.stderr = real_stderr
+        sink.close()
+
+    names = list(results)
+    print(f"{'ns per call':<18}" + "".join(f"{name:>20}" for name in names))
+    for case in results["stream"]:
+        print(f"{case:<18}" + "".join(f"{results[n][case]:>20.0f}" for n in names))
+    print()
+    for name, drain_s in drains.items():
+        print(f"{name}: listener drain on shutdown {drain_s * 1000:.1f} ms")
+    print(f"debug sampling: 1 in {settings.log_debug_sample_every}")
+
+
+if __name__ == "__main__":
+    main()
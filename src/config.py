@@ -1,8 +1,11 @@
 """Configuration management for Xyber Chatbot."""
 
+import logging
+import warnings
 from pathlib import Path
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -25,9 +28,33 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
     log_level: str = "INFO"
+    # Structured logging: JSON console output, rotating JSON file in log_dir
+    # (LOG_DIR= with an empty value disables the file), and 1-in-N sampling
+    # of DEBUG records.
+    log_json: bool = False
+    log_dir: Optional[Path] = Path("./logs")
+    log_max_bytes: int = 10_000_000
+    log_backup_count: int = 5
+    log_debug_sample_every: int = 10
     max_crawl_depth: int = 5
     request_timeout: int = 30
 
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def _check_log_level(cls, value):
+        level = str(value).strip().upper()
+        if level not in logging.getLevelNamesMapping():
+            warnings.warn(f"Unknown LOG_LEVEL {value!r}; falling back to INFO")
+            return "INFO"
+        return level
+
+    @field_validator("log_dir", mode="before")
+    @classmethod
+    def _empty_log_dir_disables_file(cls, value):
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -7,7 +7,13 @@ from langchain_groq import ChatGroq
 
 from src.config import settings
 from src.ingestion.store import DocumentStore
-from src.utils.logger import setup_logger
+from src.utils.logger import (
+    current_request_id,
+    request_context,
+    setup_logger,
+    stage_timings,
+    timed_stage,
+)
 
 logger = setup_logger(__name__)
 
@@ -28,7 +34,7 @@ class RAGPipeline:
                 groq_api_key=settings.groq_api_key,
             )
         except Exception as e:
-            logger.error(f"Error initializing GROQ: {str(e)}")
+            logger.error("Error initializing GROQ: %s", e)
             raise
 
         logger.info("RAG Pipeline initialized")
@@ -50,42 +56,73 @@ class RAGPipeline:
         """
         k = k or settings.retrieve_k
 
-        logger.info(f"Processing query: {question}")
-
-        # Retrieve relevant documents
-        retrieved_docs = self.document_store.search(question, k=k)
-
-        if not retrieved_docs:
-            return {
-                "answer": "I couldn't find any relevant information in the Xyber documentation to answer your question.",
-                "sources": [],
-                "retrieved_chunks": 0,
-                "has_answer": False,
-            }
-
-        # Format context
-        context = self._format_context(retrieved_docs)
-
-        # Build prompt
-        prompt = f"Context:\n{context}\n\nQuestion: {question}\nAnswer:"
-        try:
-            messages = [HumanMessage(content=prompt)]
-            response = self.llm.invoke(messages)
-            answer = response.content
-            sources = list(set(doc.get("source", "") for doc in retrieved_docs))
-            return {
-                "answer": answer,
-                "sources": sources,
-                "retrieved_chunks": len(retrieved_docs),
-                "has_answer": True,
-            }
-        except Exception as e:
-            return {
-                "answer": f"Error processing your question: {str(e)}",
-                "sources": [],
-                "retrieved_chunks": 0,
-                "has_answer": False,
-                "error": str(e),
-            }
+        # Reuse the id bound by the caller (e.g. the Telegram handler) if any
+        with request_context(current_request_id()):
+            # Keep the full question out of INFO output; DEBUG is sampled
+            logger.info(
+                "Processing query (%d chars)",
+                len(question),
+                extra={"question_chars": len(question)},
+            )
+            logger.debug("Query text: %s", question)
+
+            with timed_stage("retrieve_ms"):
+                # Retrieve relevant documents
+                retrieved_docs = self.document_store.search(question, k=k)
+
+            if not retrieved_docs:
+                timings = stage_timings()
+                logger.info(
+                    "Query complete: 0 chunks, retrieve %s ms",
+                    timings.get("retrieve_ms"),
+                    extra={"stages": timings, "chunks": 0},
+                )
+                return {
+                    "answer": "I couldn't find any relevant information in the Xyber documentation to answer your question.",
+                    "sources": [],
+                    "retrieved_chunks": 0,
+                    "has_answer": False,
+                }
+
+            # Format context
+            context = self._format_context(retrieved_docs)
+
+            # Build prompt
+            prompt = f"Context:\n{context}\n\nQuestion: {question}\nAnswer:"
+            try:
+                messages = [HumanMessage(content=prompt)]
+                with timed_stage("llm_ms"):
+                    response = self.llm.invoke(messages)
+                answer = response.content
+                sources = list(set(doc.get("source", "") for doc in retrieved_docs))
+                timings = stage_timings()
+                logger.info(
+                    "Query complete: %d chunks, retrieve %s ms, llm %s ms",
+                    len(retrieved_docs),
+                    timings.get("retrieve_ms"),
+                    timings.get("llm_ms"),
+                    extra={"stages": timings, "chunks": len(retrieved_docs)},
+                )
+                return {
+                    "answer": answer,
+                    "sources": sources,
+                    "retrieved_chunks": len(retrieved_docs),
+                    "has_answer": True,
+                }
+            except Exception as e:
+                timings = stage_timings()
+                logger.error(
+                    "Query failed after retrieve %s ms: %s",
+                    timings.get("retrieve_ms"),
+                    e,
+                    extra={"stages": timings},
+                )
+                return {
+                    "answer": f"Error processing your question: {str(e)}",
+                    "sources": [],
+                    "retrieved_chunks": 0,
+                    "has_answer": False,
+                    "error": str(e),
+                }
 
     # Only query method is needed for core functionality
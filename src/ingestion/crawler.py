@@ -99,7 +99,7 @@ class DocumentCrawler:
                     child_results = await task_result
                     results.update(child_results)
                 except Exception as e:
-                    logger.error(f"Error in crawl_depth: {str(e)}")
+                    logger.error("Error in crawl_depth: %s", e)
 
         return results
 
@@ -31,7 +31,7 @@ class DocumentStore:
             name="xyber_docs", metadata={"hnsw:space": "cosine"}
         )
 
-        logger.info(f"DocumentStore initialized at {self.persist_dir}")
+        logger.info("DocumentStore initialized at %s", self.persist_dir)
 
     def ingest_documents(self, documents: Dict[str, str]) -> int:
         """Ingest documents into the vector store.
@@ -42,7 +42,7 @@ class DocumentStore:
         Returns:
             Number of chunks ingested
         """
-        logger.info(f"Starting ingestion of {len(documents)} documents")
+        logger.info("Starting ingestion of %d documents", len(documents))
 
         chunks_added = 0
 
@@ -70,9 +70,9 @@ class DocumentStore:
                     )
                     chunks_added += 1
                 except Exception as e:
-                    logger.error(f"Error adding chunk {chunk_id}: {str(e)}")
+                    logger.error("Error adding chunk %s: %s", chunk_id, e)
 
-        logger.info(f"Ingestion complete. Added {chunks_added} chunks")
+        logger.info("Ingestion complete. Added %d chunks", chunks_added)
         return chunks_added
 
     def search(self, query: str, k: int = None) -> List[Dict]:
@@ -114,7 +114,7 @@ class DocumentStore:
             return formatted
 
         except Exception as e:
-            logger.error(f"Error searching: {str(e)}")
+            logger.error("Error searching: %s", e)
             return []
 
     def get_stats(self) -> Dict:
@@ -123,7 +123,7 @@ class DocumentStore:
             count = self.collection.count()
             return {"total_chunks": count, "collection_name": "xyber_docs"}
         except Exception as e:
-            logger.error(f"Error getting stats: {str(e)}")
+            logger.error("Error getting stats: %s", e)
             return {"total_chunks": 0, "collection_name": "xyber_docs"}
 
     # Only ingest_documents and search are needed for core functionality
@@ -15,7 +15,7 @@ from telegram.ext import (
 from src.config import settings
 from src.core.rag import RAGPipeline
 from src.ingestion.store import DocumentStore
-from src.utils.logger import setup_logger
+from src.utils.logger import request_context, setup_logger
 
 logger = setup_logger(__name__)
 
@@ -51,54 +51,57 @@ class XyberTelegramBot:
 
         if not question:
             return
-        # Process query through RAG pipeline
-        try:
+
+        # Bind one request id for the handler and the RAG query it awaits
+        with request_context():
             # Process query through RAG pipeline
-            result = await asyncio.wait_for(
-                self.rag_pipeline.query(question), timeout=TYPING_TIMEOUT
-            )
-
-            # Build response message
-            response_text = result["answer"]
-
-            # Add sources if available
-            if result.get("sources"):
-                response_text += "\n\n📚 Sources:"
-                for source in result["sources"][:3]:  # Limit to 3 sources
-                    response_text += f"\n• {source}"
-
-            # Add stats
-            response_text += (
-                f"\n\n✅ Found {result.get('retrieved_chunks', 0)} relevant chunks"
-            )
-
-            # Split message if too long
-            if len(response_text) > MAX_MESSAGE_LENGTH:
-                # Send in parts
-                for i in range(0, len(response_text), MAX_MESSAGE_LENGTH):
-                    chunk = response_text[i : i + MAX_MESSAGE_LENGTH]
-                    await update.message.reply_text(chunk, parse_mode="HTML")
-            else:
-                await update.message.reply_text(response_text, parse_mode="HTML")
-
-            logger.info(f"Response sent to {user_name}")
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Query timeout for user {user_name}")
-            await update.message.reply_text(
-                "⏱️ The query took too long to process. Please try a simpler question."
-            )
-        except Exception as e:
-            logger.error(f"Error processing message: {str(e)}")
-            await update.message.reply_text(
-                f"❌ Error processing your question: {str(e)}\n\nPlease try again or check your question."
-            )
+            try:
+                # Process query through RAG pipeline
+                result = await asyncio.wait_for(
+                    self.rag_pipeline.query(question), timeout=TYPING_TIMEOUT
+                )
+
+                # Build response message
+                response_text = result["answer"]
+
+                # Add sources if available
+                if result.get("sources"):
+                    response_text += "\n\n📚 Sources:"
+                    for source in result["sources"][:3]:  # Limit to 3 sources
+                        response_text += f"\n• {source}"
+
+                # Add stats
+                response_text += (
+                    f"\n\n✅ Found {result.get('retrieved_chunks', 0)} relevant chunks"
+                )
+
+                # Split message if too long
+                if len(response_text) > MAX_MESSAGE_LENGTH:
+                    # Send in parts
+                    for i in range(0, len(response_text), MAX_MESSAGE_LENGTH):
+                        chunk = response_text[i : i + MAX_MESSAGE_LENGTH]
+                        await update.message.reply_text(chunk, parse_mode="HTML")
+                else:
+                    await update.message.reply_text(response_text, parse_mode="HTML")
+
+                logger.info("Response sent to %s", user_name)
+
+            except asyncio.TimeoutError:
+                logger.warning("Query timeout for user %s", user_name)
+                await update.message.reply_text(
+                    "⏱️ The query took too long to process. Please try a simpler question."
+                )
+            except Exception as e:
+                logger.error("Error processing message: %s", e)
+                await update.message.reply_text(
+                    f"❌ Error processing your question: {str(e)}\n\nPlease try again or check your question."
+                )
 
     async def error_handler(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle errors."""
-        logger.error(f"Update {update} caused error {context.error}")
+        logger.error("Update %s caused error %s", update, context.error)
         if update and update.message:
             await update.message.reply_text("❌ An error occurred. Please try again.")
 
@@ -1,16 +1,271 @@
-"""Logging configuration for Xyber Chatbot."""
+"""Logging configuration for Xyber Chatbot.
 
+Records are handed to an in-memory queue and written by a background
+``QueueListener`` thread, so emitting a log line never blocks the event loop
+on console or file I/O. The listener (and the log directory) is only created
+when the first record is emitted, so importing a module has no side effects.
+"""
+
+import atexit
+import itertools
+import json
 import logging
 import logging.handlers
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from src.config import settings
+
+CONSOLE_FORMAT = "%(asctime)s - %(levelname)s - [%(request_id)s] %(message)s"
+LOG_FILE_NAME = "xyber.log"
+
+# Argument types that cannot change between the log call and the listener
+# formatting them; anything else is interpolated on the emitting thread.
+_DEFERRABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None), BaseException)
+
+# Attributes present on every LogRecord; anything else came in via ``extra``.
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "stage_timings", default=None
+)
+
+_lock = threading.Lock()
+_queue_handler: Optional["LazyQueueHandler"] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the current request id in the emitting task."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = _request_id.get()
+        if request_id is not None and not hasattr(record, "request_id"):
+            record.request_id = request_id
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep only one in every ``every`` DEBUG records per message template."""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counters: Dict[tuple, Iterator[int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        key = (record.name, record.msg)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % self.every == 0
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Queue records, deferring formatting to the listener where it is safe.
+
+    The stock ``QueueHandler.prepare`` merges ``msg % args`` up front, both so
+    records can be pickled and so a line reflects its arguments as they were
+    at call time. The queue here is in-process, so when every argument is an
+    immutable scalar, string or exception, interpolation is left to the
+    listener thread; otherwise the message is merged here so later mutation
+    of a dict or object cannot change what gets logged. JSON encoding always
+    happens on the listener. Values passed via ``extra`` are not copied, so
+    callers must pass snapshots (``stage_timings()`` already returns one).
+
+    The listener is started on the first emit; if that fails the record is
+    reported through ``handleError`` rather than raised. Records emitted
+    after ``stop()`` are discarded.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue):
+        super().__init__(log_queue)
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._stopped = False
+        self._start_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and not (
+            isinstance(args, tuple)
+            and all(isinstance(arg, _DEFERRABLE_ARG_TYPES) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._stopped:
+            return
+        if self._listener is None:
+            try:
+                self._start_listener()
+            except Exception:
+                self.handleError(record)
+                return
+        super().emit(record)
+
+    def _start_listener(self) -> None:
+        with self._start_lock:
+            if self._listener is None and not self._stopped:
+                listener = logging.handlers.QueueListener(
+                    self.queue, *_build_handlers(), respect_handler_level=True
+                )
+                listener.start()
+                self._listener = listener
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener; safe to call twice."""
+        with self._start_lock:
+            self._stopped = True
+            if self._listener is not None:
+                self._listener.stop()
+                for handler in self._listener.handlers:
+                    handler.close()
+                self._listener = None
+
+
+def _build_handlers() -> list:
+    """Build the listener's sinks, falling back to console-only on file errors."""
+    console = logging.StreamHandler()
+    if settings.log_json:
+        console.setFormatter(JsonFormatter())
+    else:
+        console.setFormatter(
+            logging.Formatter(CONSOLE_FORMAT, defaults={"request_id": "-"})
+        )
+    handlers = [console]
+
+    if settings.log_dir:
+        log_dir = Path(settings.log_dir)
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_dir / LOG_FILE_NAME,
+                maxBytes=settings.log_max_bytes,
+                backupCount=settings.log_backup_count,
+                encoding="utf-8",
+            )
+        except OSError as e:
+            console.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": "Log file disabled, cannot open %s: %s",
+                        "args": (log_dir / LOG_FILE_NAME, e),
+                    }
+                )
+            )
+        else:
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+    return handlers
+
+
+def _get_queue_handler() -> LazyQueueHandler:
+    """Return the shared queue handler, creating it if needed."""
+    global _queue_handler
+    with _lock:
+        if _queue_handler is None:
+            handler = LazyQueueHandler(queue.SimpleQueue())
+            handler.addFilter(RequestContextFilter())
+            handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_every))
+            _queue_handler = handler
+        return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener.
+
+    Idempotent. Loggers keep their now-stopped handler, so records emitted
+    after shutdown are discarded until ``setup_logger`` is called again.
+    """
+    global _queue_handler
+    with _lock:
+        handler, _queue_handler = _queue_handler, None
+    if handler is not None:
+        handler.stop()
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logger(name: str) -> logging.Logger:
-    """Set up a basic console logger."""
+    """Set up a logger that emits through the shared background queue."""
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
+    logger.setLevel(settings.log_level)
+    handler = _get_queue_handler()
+    for stale in logger.handlers[:]:
+        if isinstance(stale, LazyQueueHandler) and stale is not handler:
+            logger.removeHandler(stale)
+    if handler not in logger.handlers:
         logger.addHandler(handler)
+    logger.propagate = False
     return logger
+
+
+def current_request_id() -> Optional[str]:
+    """Return the request id bound to the current task, if any."""
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id: Optional[str] = None) -> Iterator[str]:
+    """Bind a request id and a fresh stage-timing table to the current task.
+
+    Pass ``current_request_id()`` to keep an id bound by an outer handler.
+    """
+    request_id = request_id or uuid.uuid4().hex[:12]
+    id_token = _request_id.set(request_id)
+    timings_token = _stage_timings.set({})
+    try:
+        yield request_id
+    finally:
+        _stage_timings.reset(timings_token)
+        _request_id.reset(id_token)
+
+
+@contextmanager
+def timed_stage(name: str) -> Iterator[None]:
+    """Record the wall-clock duration of a stage in milliseconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _stage_timings.get()
+        if timings is not None:
+            timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def stage_timings() -> Dict[str, float]:
+    """Return a copy of the stage timings recorded for the current request."""
+    return dict(_stage_timings.get() or {})
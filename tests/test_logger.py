@@ -0,0 +1,207 @@
+"""Tests for the queue-based structured logger."""
+
+import asyncio
+import json
+import logging
+import threading
+
+import pytest
+
+from src.config import Settings
+from src.utils import logger as log_module
+from src.utils.logger import (
+    DebugSamplingFilter,
+    JsonFormatter,
+    LazyQueueHandler,
+    current_request_id,
+    request_context,
+    stage_timings,
+    timed_stage,
+)
+
+
+def make_record(level=logging.DEBUG, msg="event %s", args=(1,), **extra):
+    record = logging.makeLogRecord(
+        {"name": "test", "levelno": level, "levelname": logging.getLevelName(level)}
+    )
+    record.msg = msg
+    record.args = args
+    record.__dict__.update(extra)
+    return record
+
+
+class CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.threads = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread())
+
+
+def test_sampling_keeps_one_in_n_per_template():
+    sampler = DebugSamplingFilter(every=3)
+    kept_a = [sampler.filter(make_record(msg="a %s")) for _ in range(9)]
+    kept_b = [sampler.filter(make_record(msg="b %s")) for _ in range(3)]
+
+    assert sum(kept_a) == 3
+    assert kept_a[0] and not kept_a[1] and not kept_a[2]
+    assert kept_b == [True, False, False]
+
+
+def test_sampling_passes_info_and_above():
+    sampler = DebugSamplingFilter(every=100)
+    for level in (logging.INFO, logging.WARNING, logging.ERROR):
+        assert all(sampler.filter(make_record(level=level)) for _ in range(5))
+
+
+def test_json_formatter_includes_extra_and_request_id():
+    record = make_record(
+        level=logging.INFO, request_id="abc123", stages={"retrieve_ms": 1.5}
+    )
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "event 1"
+    assert payload["request_id"] == "abc123"
+    assert payload["stages"] == {"retrieve_ms": 1.5}
+    assert payload["ts"].endswith("+00:00")
+    for reserved in ("args", "msg", "levelno", "pathname", "created", "thread"):
+        assert reserved not in payload
+
+
+def test_request_context_is_isolated_between_tasks():
+    async def handle(name, delay):
+        with request_context(name):
+            with timed_stage(name):
+                await asyncio.sleep(delay)
+            await asyncio.sleep(0)
+            return current_request_id(), stage_timings()
+
+    async def run():
+        return await asyncio.gather(handle("first", 0.02), handle("second", 0.01))
+
+    (first_id, first_stages), (second_id, second_stages) = asyncio.run(run())
+
+    assert first_id == "first" and list(first_stages) == ["first"]
+    assert second_id == "second" and list(second_stages) == ["second"]
+    assert current_request_id() is None
+    assert stage_timings() == {}
+
+
+def test_request_context_reuses_bound_id():
+    with request_context() as outer:
+        with request_context(current_request_id()) as inner:
+            assert inner == outer
+
+
+def test_queue_handler_defers_formatting_to_listener(monkeypatch):
+    capture = CaptureHandler()
+    monkeypatch.setattr(log_module, "_build_handlers", lambda: [capture])
+    format_threads = []
+
+    class Probe(Exception):
+        def __str__(self):
+            format_threads.append(threading.current_thread())
+            return "probe"
+
+    handler = LazyQueueHandler(log_module.queue.SimpleQueue())
+    record = make_record(level=logging.INFO, msg="value %s", args=(Probe(),))
+    handler.handle(record)
+
+    assert record.msg == "value %s"
+    assert format_threads == []
+
+    handler.stop()
+    handler.stop()
+
+    assert capture.messages == ["value probe"]
+    assert format_threads[0] is not threading.current_thread()
+    assert capture.threads[0] is not threading.current_thread()
+
+
+def test_mutable_args_are_snapshotted_at_call_time(monkeypatch):
+    capture = CaptureHandler()
+    monkeypatch.setattr(log_module, "_build_handlers", lambda: [capture])
+    handler = LazyQueueHandler(log_module.queue.SimpleQueue())
+    payload = {"state": "before"}
+
+    handler.handle(make_record(level=logging.INFO, msg="payload %s", args=(payload,)))
+    payload["state"] = "after"
+    handler.stop()
+
+    assert capture.messages == ["payload {'state': 'before'}"]
+
+
+def test_listener_start_failure_does_not_raise(monkeypatch):
+    def broken():
+        raise OSError("disk on fire")
+
+    monkeypatch.setattr(log_module, "_build_handlers", broken)
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    handler = LazyQueueHandler(log_module.queue.SimpleQueue())
+
+    handler.handle(make_record(level=logging.ERROR))
+    handler.handle(make_record(level=logging.ERROR))
+    handler.stop()
+
+
+def test_unusable_log_dir_falls_back_to_console(monkeypatch, tmp_path, capsys):
+    not_a_dir = tmp_path / "logs"
+    not_a_dir.write_text("")
+    monkeypatch.setattr(log_module.settings, "log_dir", not_a_dir)
+
+    handlers = log_module._build_handlers()
+
+    assert [type(h) for h in handlers] == [logging.StreamHandler]
+    assert "Log file disabled" in capsys.readouterr().err
+
+
+def test_console_format_shows_request_id(monkeypatch):
+    monkeypatch.setattr(log_module.settings, "log_dir", None)
+    handler = log_module._build_handlers()[0]
+    record = make_record(level=logging.INFO, request_id="abc123")
+    unbound = make_record(level=logging.INFO)
+
+    assert "[abc123] event 1" in handler.format(record)
+    assert "[-] event 1" in handler.format(unbound)
+
+
+def test_records_after_stop_are_discarded(monkeypatch):
+    capture = CaptureHandler()
+    monkeypatch.setattr(log_module, "_build_handlers", lambda: [capture])
+    handler = LazyQueueHandler(log_module.queue.SimpleQueue())
+    handler.stop()
+
+    handler.handle(make_record(level=logging.INFO))
+
+    assert capture.messages == []
+
+
+def test_setup_logger_replaces_stopped_handler(monkeypatch):
+    monkeypatch.setattr(log_module, "_build_handlers", lambda: [CaptureHandler()])
+    logger = log_module.setup_logger("test.replace")
+    stale = logger.handlers[0]
+
+    log_module.shutdown_logging()
+    log_module.shutdown_logging()
+    logger = log_module.setup_logger("test.replace")
+
+    assert stale not in logger.handlers
+    assert len(logger.handlers) == 1
+    log_module.shutdown_logging()
+
+
+@pytest.mark.parametrize("raw, expected", [("debug", "DEBUG"), ("Warning", "WARNING")])
+def test_log_level_is_normalised(raw, expected):
+    assert Settings(log_level=raw).log_level == expected
+
+
+def test_unknown_log_level_falls_back_to_info():
+    with pytest.warns(UserWarning):
+        assert Settings(log_level="verbose").log_level == "INFO"
+
+
+def test_empty_log_dir_disables_file():
+    assert Settings(log_dir="").log_dir is None